@@ -1,21 +1,244 @@
 import asyncio
 import os
-import json
-from typing import Optional, List, Dict, Any
+import re
+import sys
+from functools import lru_cache
+from itertools import islice
 from dotenv import load_dotenv
 from agno.agent import Agent
-from agno.models.azure.openai_chat import AzureOpenAI
 from agno.models.ollama import Ollama
 from agno.tools.mcp import MCPTools
 from agno.storage.sqlite import SqliteStorage
-from rich import print
+from mcp import StdioServerParameters
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
-from datetime import datetime
+from rich.text import Text
+from rich.prompt import Prompt, Confirm
+from sqlalchemy import event
+
+__all__ = ["EnhancedResearchAgent", "main"]
 
 load_dotenv()
-console = Console()
+# Rich drops colour codes when stdout is not a terminal; the repr highlighter's
+# regex pass over every printed string is skipped there too
+console = Console(highlight=sys.stdout.isatty())
+
+# server.py is launched with the running interpreter as an argv list, which
+# skips the PATH lookup for "python" and shell-style splitting of the command
+_SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+
+# One MCP server subprocess is shared by every EnhancedResearchAgent in the
+# process: it is started by the first acquire and stopped by the last release.
+# Acquire and release must run in the same task, as MCPTools' context does.
+_MCP_POOL: MCPTools | None = None
+_MCP_REFS = 0
+_MCP_LOCK = asyncio.Lock()
+
+async def _acquire_mcp_tools() -> MCPTools:
+    """Return the shared, connected MCP tools, starting the server on first use"""
+    global _MCP_POOL, _MCP_REFS
+    async with _MCP_LOCK:
+        if _MCP_POOL is None:
+            server_params = StdioServerParameters(
+                command=sys.executable, args=[_SERVER_PATH], env=dict(os.environ)
+            )
+            mcp_tools = MCPTools(server_params=server_params)
+            await mcp_tools.__aenter__()
+            _MCP_POOL = mcp_tools
+        _MCP_REFS += 1
+        return _MCP_POOL
+
+async def _release_mcp_tools() -> None:
+    """Drop one reference to the shared MCP tools, stopping the server on the last"""
+    global _MCP_POOL, _MCP_REFS
+    async with _MCP_LOCK:
+        if _MCP_POOL is None:
+            return
+        _MCP_REFS -= 1
+        if _MCP_REFS == 0:
+            mcp_tools, _MCP_POOL = _MCP_POOL, None
+            await mcp_tools.__aexit__(None, None, None)
+
+# Research topics are the first three words longer than four characters;
+# scanning stops as soon as they are found
+_RESEARCH_TERM_RE = re.compile(r"\S{5,}")
+
+# Demo confirmations are skipped when stdin is not a terminal (CI, piped input)
+_INTERACTIVE = sys.stdin.isatty() and not os.getenv("AGENT_NONINTERACTIVE")
+
+# Dashboard templates: static markup lives here so only the dynamic fields
+# are substituted per call
+_STATUS_TEMPLATE = """
+            [bold blue]Enhanced Research Agent Status[/bold blue]
+
+            🆔 User ID: [yellow]{user_id}[/yellow]
+            📍 Session: [yellow]{session_id}[/yellow]
+            🧠 Memory: [green]Active (Built-in Agno)[/green]
+            📊 Context Depth: [cyan]25 messages[/cyan]
+            🔧 Tools: [green]{tools}[/green]
+            🗃️ Storage: [green]{storage}[/green]
+
+            [bold green]Demo Metrics:[/bold green]
+            • Queries Processed: {queries}
+            • Successful Responses: {successful}
+            • Sessions Created: {sessions}
+            • Research Topics: {topic_count}
+            """
+
+_METRICS_TEMPLATE = """
+            [bold green]Research Agent Analytics[/bold green]
+
+            📊 [bold]Usage Statistics:[/bold]
+            • Total Queries: [cyan]{queries}[/cyan]
+            • Successful Responses: [cyan]{successful}[/cyan]
+            • Success Rate: [cyan]{success_rate:.1f}%[/cyan]
+            • Sessions Created: [cyan]{sessions}[/cyan]
+
+            🧠 [bold]Research Coverage:[/bold]
+            • Unique Topics: [cyan]{topic_count}[/cyan]
+            • Topics: [yellow]{topics}[/yellow]
+
+            ⚡ [bold]Agent Performance:[/bold]
+            • Memory System: [green]Agno Built-in ✓[/green]
+            • MCP Integration: [green]Active ✓[/green]
+            • Session Persistence: [green]SQLite Storage ✓[/green]
+            • Multi-tool Support: [green]Active ✓[/green]
+            """
+
+# Static panels are built once at import. Markup nested in a panel is not
+# highlighted, so it is rendered through the console's own highlighting setting.
+_HELP_PANEL = Panel.fit(
+    console.render_str("""
+        [bold blue]Enhanced Research Agent - Commands[/bold blue]
+
+        [bold yellow]Special Commands:[/bold yellow]
+        • [cyan]demo[/cyan] - Run capability demonstration
+        • [cyan]status[/cyan] - Show agent status and context
+        • [cyan]metrics[/cyan] - Display usage analytics
+        • [cyan]help[/cyan] - Show this help message
+        • [cyan]quit[/cyan] - Exit the application
+
+        [bold yellow]Research Capabilities:[/bold yellow]
+        • Persistent memory across sessions (Agno built-in)
+        • Multi-strategy search and research via MCP tools
+        • Source verification and cross-referencing
+        • Proactive insights and suggestions
+        • Contextual conversation building
+
+        [bold yellow]Example Queries:[/bold yellow]
+        • "Research the latest AI developments in 2025"
+        • "What did we discuss about [topic] last time?"
+        • "Compare different approaches to [problem]"
+        • "What should I investigate next about [topic]?"
+
+        [bold yellow]Agent Features:[/bold yellow]
+        • Built on official Agno framework
+        • Leverages Agno's memory management
+        • MCP tool integration for search capabilities
+        • SQLite storage for session persistence
+            """),
+    title="Help & Commands",
+    border_style="yellow"
+)
+
+_BANNER_PANEL = Panel.fit(
+    console.render_str("""
+        [bold blue]🚀 Enhanced Agno Research Agent v2.0[/bold blue]
+
+        [green]✨ Production-Ready Features:[/green]
+        • Built on official Agno framework
+        • Leverages Agno's built-in memory management  
+        • Advanced MCP tool integration
+        • Comprehensive session persistence
+        • Real-time metrics and monitoring
+        • Interactive demo capabilities
+        • Professional customer showcase ready
+
+        [yellow]🎯 Perfect for demonstrating enterprise AI capabilities![/yellow]
+
+        [dim]Following official Agno documentation and best practices[/dim]
+        """),
+    title="🤖 AI Research Assistant",
+    border_style="blue"
+)
+
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Tune each SQLite connection the storage engine opens"""
+    # WAL lets dashboard reads proceed while a run is being saved, and with
+    # synchronous=NORMAL a commit no longer waits on an fsync of the database
+    dbapi_connection.execute("PRAGMA journal_mode=WAL")
+    dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+    dbapi_connection.execute("PRAGMA busy_timeout=5000")
+    dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+    dbapi_connection.execute("PRAGMA cache_size=-65536")
+    # Serve page reads from a memory map instead of copying them through read()
+    dbapi_connection.execute("PRAGMA mmap_size=268435456")
+
+@lru_cache(maxsize=None)
+def _get_storage(table_name: str, db_file: str) -> SqliteStorage:
+    """Return the process-wide storage for a table, so its engine and connection pool are reused"""
+    storage = SqliteStorage(table_name=table_name, db_file=db_file)
+    event.listen(storage.db_engine, "connect", _configure_sqlite_connection)
+    # Drop the connection opened while inspecting the schema so every pooled
+    # connection goes through the hook
+    storage.db_engine.dispose()
+    
+    try:
+        storage.create()
+    except Exception as e:
+        console.print(f"⚠️ [yellow]Session table not created: {e}[/yellow]")
+        return storage
+    
+    # Session listing selects session_id filtered on user_id and ordered by
+    # created_at; a covering index answers it without touching the row pages
+    # that hold the memory blobs
+    try:
+        with storage.db_engine.begin() as connection:
+            connection.exec_driver_sql(
+                f"CREATE INDEX IF NOT EXISTS ix_{table_name}_user_id_created_at_session_id "
+                f"ON {table_name} (user_id, created_at DESC, session_id)"
+            )
+    except Exception as e:
+        console.print(f"⚠️ [yellow]Session index not created: {e}[/yellow]")
+    return storage
+
+# Agent instructions, defined once and handed to Agent() by reference
+_AGENT_INSTRUCTIONS = """
+            You are an elite AI research assistant with persistent memory and advanced analytical capabilities.
+            
+            🧠 MEMORY & CONTEXT:
+            - You maintain perfect memory across all sessions and conversations
+            - Always acknowledge returning users and reference previous discussions
+            - Build upon past research findings and continue incomplete investigations
+            - Use contextual awareness to provide increasingly sophisticated insights
+            
+            🔍 RESEARCH METHODOLOGY:
+            - Always start with your existing knowledge, then verify and expand with searches
+            - Use multiple search strategies: broad overview → specific deep-dives → validation
+            - Cross-reference findings from multiple sources for accuracy
+            - Synthesize information into actionable insights
+            
+            🎯 AGENTIC BEHAVIORS:
+            - Take initiative to suggest related research directions
+            - Proactively identify knowledge gaps and fill them
+            - Challenge assumptions and verify controversial claims
+            - Maintain intellectual curiosity and ask follow-up questions
+            
+            🛠️ AVAILABLE TOOLS:
+            - web_search: General web search for current information
+            - news_search: Recent news articles and developments  
+            - smart_search: Multi-strategy intelligent search with persistence
+            - research_search: Comprehensive academic and authoritative research
+            
+            💬 INTERACTION STYLE:
+            - Be conversational yet professional
+            - Explain your reasoning process clearly
+            - Provide source citations for all claims
+            - Offer to dive deeper into any aspect of your findings
+            - Remember: You're not just answering questions, you're a research partner
+            
+            Always begin responses to returning users with acknowledgment of our shared context!
+            """
 
 class EnhancedResearchAgent:
     """
@@ -30,6 +253,7 @@ class EnhancedResearchAgent:
         self.storage = None
         self.azure_model = None
         self.mcp_tools = None
+        self.session_ids = None  # User's stored sessions, as listed by create_agent
         
         # Demo metrics for showcasing
         self.metrics = {
@@ -56,7 +280,7 @@ class EnhancedResearchAgent:
         )
         
         # Setup storage with proper configuration
-        self.storage = SqliteStorage(
+        self.storage = _get_storage(
             table_name="research_agent_sessions",
             db_file="data/research_agent.db"
         )
@@ -69,8 +293,7 @@ class EnhancedResearchAgent:
     async def setup_mcp_connection(self):
         """Setup MCP tools connection"""
         try:
-            mcp_command = f"python {os.path.abspath('server.py')}"
-            self.mcp_tools = MCPTools(command=mcp_command)
+            self.mcp_tools = await _acquire_mcp_tools()
             console.print("✅ [green]MCP server connected successfully[/green]")
         except Exception as e:
             console.print(f"❌ [red]MCP connection failed: {e}[/red]")
@@ -83,8 +306,10 @@ class EnhancedResearchAgent:
         if resume_session and self.storage:
             try:
                 # Get existing sessions for this user
-                if hasattr(self.storage, 'get_all_session_ids'):
-                    existing_sessions = self.storage.get_all_session_ids(self.user_id)
+                get_all_session_ids = getattr(self.storage, 'get_all_session_ids', None)
+                if get_all_session_ids is not None:
+                    existing_sessions = get_all_session_ids(self.user_id)
+                    self.session_ids = existing_sessions
                     if existing_sessions:
                         # Use the most recent session (first in list)
                         self.session_id = existing_sessions[0]
@@ -120,42 +345,7 @@ class EnhancedResearchAgent:
             show_tool_calls=True,
             debug_mode=False,  # Set to True for debugging
             
-            instructions="""
-            You are an elite AI research assistant with persistent memory and advanced analytical capabilities.
-            
-            🧠 MEMORY & CONTEXT:
-            - You maintain perfect memory across all sessions and conversations
-            - Always acknowledge returning users and reference previous discussions
-            - Build upon past research findings and continue incomplete investigations
-            - Use contextual awareness to provide increasingly sophisticated insights
-            
-            🔍 RESEARCH METHODOLOGY:
-            - Always start with your existing knowledge, then verify and expand with searches
-            - Use multiple search strategies: broad overview → specific deep-dives → validation
-            - Cross-reference findings from multiple sources for accuracy
-            - Synthesize information into actionable insights
-            
-            🎯 AGENTIC BEHAVIORS:
-            - Take initiative to suggest related research directions
-            - Proactively identify knowledge gaps and fill them
-            - Challenge assumptions and verify controversial claims
-            - Maintain intellectual curiosity and ask follow-up questions
-            
-            🛠️ AVAILABLE TOOLS:
-            - web_search: General web search for current information
-            - news_search: Recent news articles and developments  
-            - smart_search: Multi-strategy intelligent search with persistence
-            - research_search: Comprehensive academic and authoritative research
-            
-            💬 INTERACTION STYLE:
-            - Be conversational yet professional
-            - Explain your reasoning process clearly
-            - Provide source citations for all claims
-            - Offer to dive deeper into any aspect of your findings
-            - Remember: You're not just answering questions, you're a research partner
-            
-            Always begin responses to returning users with acknowledgment of our shared context!
-            """,
+            instructions=_AGENT_INSTRUCTIONS,
         )
         
         console.print("🤖 [green]Enhanced agent created successfully[/green]")
@@ -171,32 +361,31 @@ class EnhancedResearchAgent:
     async def display_agent_status(self):
         """Display comprehensive agent status for demo purposes"""
         
-        # Create rich status display
         status_panel = Panel.fit(
-            f"""
-            [bold blue]Enhanced Research Agent Status[/bold blue]
-
-            🆔 User ID: [yellow]{self.user_id}[/yellow]
-            📍 Session: [yellow]{self.agent.session_id if self.agent else 'Not Created'}[/yellow]
-            🧠 Memory: [green]Active (Built-in Agno)[/green]
-            📊 Context Depth: [cyan]25 messages[/cyan]
-            🔧 Tools: [green]{'Connected' if self.mcp_tools else 'Disconnected'}[/green]
-            🗃️ Storage: [green]{'Active' if self.storage else 'Disabled'}[/green]
-
-            [bold green]Demo Metrics:[/bold green]
-            • Queries Processed: {self.metrics['queries_processed']}
-            • Successful Responses: {self.metrics['successful_responses']}
-            • Sessions Created: {self.metrics['sessions_created']}
-            • Research Topics: {len(self.metrics['research_topics'])}
-            """,
+            console.render_str(_STATUS_TEMPLATE.format(
+                user_id=self.user_id,
+                session_id=self.agent.session_id if self.agent else 'Not Created',
+                tools='Connected' if self.mcp_tools else 'Disconnected',
+                storage='Active' if self.storage else 'Disabled',
+                queries=self.metrics['queries_processed'],
+                successful=self.metrics['successful_responses'],
+                sessions=self.metrics['sessions_created'],
+                topic_count=len(self.metrics['research_topics']),
+            )),
             title="🎯 Agent Dashboard",
             border_style="blue"
         )
         
-        console.print(status_panel)
-        
-        # Show conversation context if available
-        await self.show_conversation_context()
+        # Render the panel and context together and print them in one go; whatever
+        # was rendered is still printed if the context lookup raises
+        try:
+            with console.capture() as capture:
+                console.print(status_panel)
+                
+                # Show conversation context if available
+                await self.show_conversation_context()
+        finally:
+            console.print(Text.from_ansi(capture.get()))
     
     async def show_conversation_context(self):
         """Display conversation context using Agno's built-in memory"""
@@ -208,6 +397,8 @@ class EnhancedResearchAgent:
                 
                 # Use official Agno method to get messages
                 try:
+                    # Stored runs are parsed on the first call only; later runs keep
+                    # the agent's memory current
                     messages = self.agent.get_messages_for_session()
                     if messages:
                         message_count = len(messages)
@@ -215,11 +406,13 @@ class EnhancedResearchAgent:
                         console.print(f"  [green]✓ Memory system active - previous context loaded[/green]")
                         
                         # Show a preview of the last few messages
-                        recent_messages = messages[-3:] if len(messages) > 3 else messages
-                        for i, msg in enumerate(recent_messages, 1):
+                        preview_lines = []
+                        for i, msg in enumerate(messages[-3:], 1):
                             role = getattr(msg, 'role', 'unknown')
-                            content_preview = str(getattr(msg, 'content', ''))[:50] + "..." if len(str(getattr(msg, 'content', ''))) > 50 else str(getattr(msg, 'content', ''))
-                            console.print(f"    [dim]{i}. {role}: {content_preview}[/dim]")
+                            content = str(getattr(msg, 'content', ''))
+                            content_preview = content[:50] + "..." if len(content) > 50 else content
+                            preview_lines.append(f"    [dim]{i}. {role}: {content_preview}[/dim]")
+                        console.print("\n".join(preview_lines))
                         
                         console.print("  [green]✓ Previous context will be automatically included in responses[/green]")
                         return
@@ -232,9 +425,15 @@ class EnhancedResearchAgent:
                 # Check if storage has session data
                 if self.storage:
                     try:
-                        # Get all sessions for this user to see if there's history
-                        if hasattr(self.storage, 'get_all_sessions'):
-                            sessions = self.storage.get_all_sessions(user_id=self.user_id)
+                        # Get all sessions for this user to see if there's history,
+                        # reusing the listing create_agent already fetched. Only the
+                        # ids are selected; full rows would load every memory blob.
+                        get_all_session_ids = getattr(self.storage, 'get_all_session_ids', None)
+                        if self.session_ids is not None or get_all_session_ids is not None:
+                            sessions = (
+                                self.session_ids if self.session_ids is not None
+                                else get_all_session_ids(self.user_id)
+                            )
                             if sessions:
                                 session_count = len(sessions)
                                 console.print(f"  [green]✓ Found {session_count} previous sessions in storage[/green]")
@@ -260,9 +459,8 @@ class EnhancedResearchAgent:
         self.metrics["queries_processed"] += 1
         
         # Extract research topics for metrics
-        keywords = query.lower().split()
-        research_terms = [word for word in keywords if len(word) > 4]
-        self.metrics["research_topics"].update(research_terms[:3])
+        research_terms = islice(_RESEARCH_TERM_RE.finditer(query.lower()), 3)
+        self.metrics["research_topics"].update(match.group() for match in research_terms)
         
         try:
             # Use Agno's built-in print_response method (most common pattern)
@@ -274,7 +472,8 @@ class EnhancedResearchAgent:
             
         except Exception as e:
             console.print(f"❌ [red]Query processing error: {e}[/red]")
-            console.print(f"🔧 [yellow]Attempted query: {query[:100]}...[/yellow]")
+            query_preview = query[:100] + "..." if len(query) > 100 else query
+            console.print(f"🔧 [yellow]Attempted query: {query_preview}[/yellow]")
     
     async def demo_capabilities(self):
         """Demonstrate key agent capabilities for customer showcase"""
@@ -304,7 +503,7 @@ class EnhancedResearchAgent:
             console.print(f"[dim]{scenario['description']}[/dim]")
             console.print(f"[yellow]Query: {scenario['query']}[/yellow]")
             
-            if Confirm.ask("Run this demo?", default=True):
+            if not _INTERACTIVE or Confirm.ask("Run this demo?", default=True):
                 await self.process_query(scenario['query'])
                 console.print("\n" + "─" * 60)
         
@@ -315,23 +514,25 @@ class EnhancedResearchAgent:
         console.print("[dim]Commands: 'demo', 'status', 'metrics', 'help', 'quit'[/dim]")
         console.print("─" * 70)
         
+        # Special commands, resolved with one lookup per input
+        commands = {
+            'demo': self.demo_capabilities,
+            'status': self.display_agent_status,
+            'metrics': self.show_metrics,
+            'help': self.show_help,
+        }
+        
         while True:
             try:
                 query = Prompt.ask(f"\n[bold cyan]{self.user_id}[/bold cyan]")
+                command = query.lower()
                 
-                if query.lower() == 'quit':
+                if command == 'quit':
                     break
-                elif query.lower() == 'demo':
-                    await self.demo_capabilities()
-                    continue
-                elif query.lower() == 'status':
-                    await self.display_agent_status()
-                    continue
-                elif query.lower() == 'metrics':
-                    await self.show_metrics()
-                    continue
-                elif query.lower() == 'help':
-                    self.show_help()
+                elif command in commands:
+                    result = commands[command]()
+                    if asyncio.iscoroutine(result):
+                        await result
                     continue
                 elif not query.strip():
                     continue
@@ -347,31 +548,18 @@ class EnhancedResearchAgent:
     async def show_metrics(self):
         """Display comprehensive metrics for demo purposes"""
         
-        success_rate = (
-            (self.metrics['successful_responses'] / self.metrics['queries_processed'] * 100)
-            if self.metrics['queries_processed'] > 0 else 0
-        )
+        # successful_responses is 0 whenever queries_processed is, so max() stands in for the guard
+        success_rate = self.metrics['successful_responses'] * 100.0 / max(self.metrics['queries_processed'], 1)
         
         metrics_panel = Panel.fit(
-            f"""
-            [bold green]Research Agent Analytics[/bold green]
-
-            📊 [bold]Usage Statistics:[/bold]
-            • Total Queries: [cyan]{self.metrics['queries_processed']}[/cyan]
-            • Successful Responses: [cyan]{self.metrics['successful_responses']}[/cyan]
-            • Success Rate: [cyan]{success_rate:.1f}%[/cyan]
-            • Sessions Created: [cyan]{self.metrics['sessions_created']}[/cyan]
-
-            🧠 [bold]Research Coverage:[/bold]
-            • Unique Topics: [cyan]{len(self.metrics['research_topics'])}[/cyan]
-            • Topics: [yellow]{', '.join(list(self.metrics['research_topics'])[:5]) if self.metrics['research_topics'] else 'None yet'}[/yellow]
-
-            ⚡ [bold]Agent Performance:[/bold]
-            • Memory System: [green]Agno Built-in ✓[/green]
-            • MCP Integration: [green]Active ✓[/green]
-            • Session Persistence: [green]SQLite Storage ✓[/green]
-            • Multi-tool Support: [green]Active ✓[/green]
-            """,
+            console.render_str(_METRICS_TEMPLATE.format(
+                queries=self.metrics['queries_processed'],
+                successful=self.metrics['successful_responses'],
+                success_rate=success_rate,
+                sessions=self.metrics['sessions_created'],
+                topic_count=len(self.metrics['research_topics']),
+                topics=', '.join(list(self.metrics['research_topics'])[:5]) if self.metrics['research_topics'] else 'None yet',
+            )),
             title="📈 Performance Dashboard",
             border_style="green"
         )
@@ -379,52 +567,15 @@ class EnhancedResearchAgent:
     
     def show_help(self):
         """Display help information"""
-        help_panel = Panel.fit(
-            """
-        [bold blue]Enhanced Research Agent - Commands[/bold blue]
-
-        [bold yellow]Special Commands:[/bold yellow]
-        • [cyan]demo[/cyan] - Run capability demonstration
-        • [cyan]status[/cyan] - Show agent status and context
-        • [cyan]metrics[/cyan] - Display usage analytics
-        • [cyan]help[/cyan] - Show this help message
-        • [cyan]quit[/cyan] - Exit the application
-
-        [bold yellow]Research Capabilities:[/bold yellow]
-        • Persistent memory across sessions (Agno built-in)
-        • Multi-strategy search and research via MCP tools
-        • Source verification and cross-referencing
-        • Proactive insights and suggestions
-        • Contextual conversation building
-
-        [bold yellow]Example Queries:[/bold yellow]
-        • "Research the latest AI developments in 2025"
-        • "What did we discuss about [topic] last time?"
-        • "Compare different approaches to [problem]"
-        • "What should I investigate next about [topic]?"
-
-        [bold yellow]Agent Features:[/bold yellow]
-        • Built on official Agno framework
-        • Leverages Agno's memory management
-        • MCP tool integration for search capabilities
-        • SQLite storage for session persistence
-            """,
-            title="Help & Commands",
-            border_style="yellow"
-        )
-        console.print(help_panel)
+        console.print(_HELP_PANEL)
     
     async def cleanup(self):
         """Cleanup resources properly"""
         try:
             if self.mcp_tools:
-                # Proper MCP cleanup - check if it has async exit method
-                if hasattr(self.mcp_tools, '__aexit__'):
-                    await self.mcp_tools.__aexit__(None, None, None)
-                # elif hasattr(self.mcp_tools, 'close'):
-                #     await self.mcp_tools.close()
-                # elif hasattr(self.mcp_tools, 'cleanup'):
-                #     await self.mcp_tools.cleanup()
+                # Release our reference; the server is stopped by the last user
+                self.mcp_tools = None
+                await _release_mcp_tools()
             console.print("🧹 [dim]Resources cleaned up[/dim]")
         except Exception as e:
             console.print(f"⚠️ [yellow]Cleanup warning: {e}[/yellow]")
@@ -432,27 +583,9 @@ class EnhancedResearchAgent:
 async def main():
     """Main application entry point"""
     
-    # Enhanced startup display
-    console.print(Panel.fit(
-        """
-        [bold blue]🚀 Enhanced Agno Research Agent v2.0[/bold blue]
-
-        [green]✨ Production-Ready Features:[/green]
-        • Built on official Agno framework
-        • Leverages Agno's built-in memory management  
-        • Advanced MCP tool integration
-        • Comprehensive session persistence
-        • Real-time metrics and monitoring
-        • Interactive demo capabilities
-        • Professional customer showcase ready
-
-        [yellow]🎯 Perfect for demonstrating enterprise AI capabilities![/yellow]
-
-        [dim]Following official Agno documentation and best practices[/dim]
-        """,
-        title="🤖 AI Research Assistant",
-        border_style="blue"
-    ))
+    # Enhanced startup display (decorative, so only drawn on a terminal)
+    if console.is_terminal:
+        console.print(_BANNER_PANEL)
     
     # Get user configuration
     user_id = Prompt.ask("👤 [cyan]Enter user ID[/cyan]", default="demo_customer")
@@ -465,17 +598,12 @@ async def main():
         await agent_system.initialize()
         await agent_system.setup_mcp_connection()
         
-        # Use proper async context manager for MCP tools
-        if agent_system.mcp_tools:
-            async with agent_system.mcp_tools:
-                await agent_system.create_agent(resume_session=resume_session)
-                await agent_system.display_agent_status()
-                await agent_system.interactive_session()
-        else:
+        # The shared MCP connection is already open; cleanup() releases it
+        if not agent_system.mcp_tools:
             console.print("⚠️ [yellow]MCP tools not available, running without search capabilities[/yellow]")
-            await agent_system.create_agent(resume_session=resume_session)
-            await agent_system.display_agent_status()
-            await agent_system.interactive_session()
+        await agent_system.create_agent(resume_session=resume_session)
+        await agent_system.display_agent_status()
+        await agent_system.interactive_session()
             
     except KeyboardInterrupt:
         console.print("\n👋 [yellow]Goodbye![/yellow]")
@@ -486,4 +614,10 @@ async def main():
         await agent_system.cleanup()
 
 if __name__ == "__main__":
+    # uvloop is optional; it replaces the default selector loop on Linux/macOS
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -10,22 +10,30 @@ and robust error handling with retry logic.
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
 
 try:
     import asyncio
+    import hashlib
     import json
     import logging
-    from typing import Any, Dict, List, Optional, Sequence
+    import math
+    import random
+    import time
+    from collections import OrderedDict
+    from dataclasses import dataclass, field
+    from functools import lru_cache
+    from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
     from urllib.parse import quote_plus
     import aiohttp
     from datetime import datetime, timedelta
+    from types import MappingProxyType
 
     # Load environment variables from .env file
     from dotenv import load_dotenv
     
     # Load .env from the script's directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
     env_path = os.path.join(script_dir, '.env')
     load_dotenv(env_path)
 
@@ -39,17 +47,45 @@ except Exception as e:
     print(f"❌ Unexpected error during imports: {e}", file=sys.stderr)
     sys.exit(1)
 
+# orjson is optional; it parses the API responses noticeably faster than json
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Only offer Brotli when aiohttp can decode it (the brotli or brotlicffi package is installed)
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:
+    HAS_BROTLI = False
+ACCEPT_ENCODING = "br, gzip" if HAS_BROTLI else "gzip"
+
 # Configure logging to stderr (important for MCP)
+log_level_name = (os.getenv("LOG_LEVEL") or "INFO").upper()
+log_level = logging.getLevelName(log_level_name)
+log_level_valid = isinstance(log_level, int)
 logging.basicConfig(
-    level=logging.INFO,
+    level=log_level if log_level_valid else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     stream=sys.stderr  # Use stderr for logging in MCP
 )
 logger = logging.getLogger("brave-search-mcp")
+if not log_level_valid:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", log_level_name)
 
 # Configuration
 BRAVE_API_KEY = os.getenv("BRAVE_API_KEY")
 BRAVE_BASE_URL = "https://api.search.brave.com/res/v1"
+BRAVE_MAX_ATTEMPTS = 4
+BRAVE_MAX_BACKOFF = 30.0
+try:
+    BRAVE_MAX_CONCURRENCY = max(int(os.getenv("BRAVE_MAX_CONCURRENCY") or "8"), 1)
+except ValueError:
+    logger.warning("Invalid BRAVE_MAX_CONCURRENCY %r, using 8", os.getenv("BRAVE_MAX_CONCURRENCY"))
+    BRAVE_MAX_CONCURRENCY = 8
+HTTP_CONNECTION_LIMIT = 64
+HTTP_DNS_CACHE_TTL = 300
 
 # Log to stderr for debugging (Claude Code will capture this)
 if not BRAVE_API_KEY:
@@ -57,6 +93,32 @@ if not BRAVE_API_KEY:
 else:
     logger.info("BRAVE_API_KEY loaded successfully")
 
+# One HTTP session for the whole process so tool calls reuse pooled
+# connections instead of paying DNS, TCP and TLS setup on every request
+http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use"""
+    global http_session
+    if http_session is None or http_session.closed:
+        # Every request goes to one host, so the per-host limit is the total limit
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL
+        )
+        http_session = aiohttp.ClientSession(connector=connector, headers={
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "X-Subscription-Token": BRAVE_API_KEY or ""
+        })
+    return http_session
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session if it is open"""
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+
 # Initialize the FastMCP server
 mcp = FastMCP("Brave Search API Server")
 
@@ -64,95 +126,231 @@ mcp = FastMCP("Brave Search API Server")
 logger.info("🚀 Initializing Brave Search MCP Server...")
 logger.info("📡 Server ready to accept connections")
 
+class TTLCache:
+    """In-memory LRU cache whose entries expire ttl after they are set"""
+    
+    def __init__(self, maxsize: int, ttl: timedelta):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return a cached value, or None if it is missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: bytes, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries past maxsize"""
+        self._entries[key] = (time.monotonic() + self.ttl.total_seconds(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._entries.clear()
+
 # Search result cache for efficiency
-search_cache = {}
-cache_ttl = timedelta(hours=1)
+search_cache = TTLCache(maxsize=1024, ttl=timedelta(hours=1))
+
+# Caps simultaneous Brave API requests so concurrent tool fan-out does not trip the rate limit
+brave_request_semaphore = asyncio.Semaphore(BRAVE_MAX_CONCURRENCY)
 
 class BraveSearchError(Exception):
     """Custom exception for Brave Search API errors"""
-    pass
+    
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+    
+    @property
+    def is_client_error(self) -> bool:
+        """True for 4xx responses other than rate limiting, which will fail again if repeated"""
+        return self.status is not None and 400 <= self.status < 500 and self.status != 429
+
+# Result rows are slotted dataclasses rather than dicts: a fraction of the
+# memory per cached row, and they serialize to the same JSON objects
+
+@dataclass(slots=True)
+class WebResult:
+    """A web search result"""
+    type: str = field(default="web", init=False)
+    title: str
+    url: str
+    description: str
+    snippet: str
+    age: str
+    language: str
+
+@dataclass(slots=True)
+class NewsResult:
+    """A news article result"""
+    type: str = field(default="news", init=False)
+    title: str
+    url: str
+    description: str
+    age: str
+    source: str
+
+@dataclass(slots=True)
+class FAQResult:
+    """A FAQ entry result"""
+    type: str = field(default="faq", init=False)
+    question: str
+    answer: str
+    title: str
+    url: str
+
+SearchResult = Union[WebResult, NewsResult, FAQResult]
+
+# Shared read-only default for missing response sections and nested objects
+EMPTY_MAPPING = MappingProxyType({})
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before a retry: the server's Retry-After if usable, else jittered exponential backoff"""
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = None
+        # "nan" and "inf" parse as floats but are not usable delays
+        if delay is not None and math.isfinite(delay):
+            return min(max(delay, 0.0), BRAVE_MAX_BACKOFF)
+    return min(2 ** attempt + random.random(), BRAVE_MAX_BACKOFF)
 
 async def make_brave_request(
     endpoint: str,
-    params: Dict[str, Any],
-    session: aiohttp.ClientSession
+    params: Dict[str, Any]
 ) -> Dict[str, Any]:
     """
     Make a request to the Brave Search API with error handling
+
+    Rate limiting, server errors and network errors are retried with backoff
+    up to BRAVE_MAX_ATTEMPTS times; other client errors fail immediately.
     """
     if not BRAVE_API_KEY:
         raise BraveSearchError("Brave API key not configured")
     
-    headers = {
-        "Accept": "application/json",
-        "Accept-Encoding": "gzip",
-        "X-Subscription-Token": BRAVE_API_KEY
-    }
-    
     url = f"{BRAVE_BASE_URL}/{endpoint}"
     
-    try:
-        async with session.get(url, headers=headers, params=params) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                raise BraveSearchError("Rate limit exceeded. Please try again later.")
-            elif response.status == 401:
-                raise BraveSearchError("Invalid API key or authentication failed.")
-            elif response.status == 400:
-                raise BraveSearchError("Invalid search parameters.")
-            else:
-                raise BraveSearchError(f"API request failed with status {response.status}")
-    except aiohttp.ClientError as e:
-        raise BraveSearchError(f"Network error: {str(e)}")
-
-def extract_search_results(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    for attempt in range(BRAVE_MAX_ATTEMPTS):
+        retry_after = None
+        try:
+            async with brave_request_semaphore:
+                async with get_http_session().get(url, params=params) as response:
+                    if response.status == 200:
+                        try:
+                            return json_loads(await response.read())
+                        except ValueError as e:
+                            raise BraveSearchError(f"Invalid JSON response: {str(e)}")
+                    elif response.status == 429:
+                        error = BraveSearchError("Rate limit exceeded. Please try again later.", response.status)
+                        retry_after = response.headers.get("Retry-After")
+                    elif response.status == 401:
+                        raise BraveSearchError("Invalid API key or authentication failed.", response.status)
+                    elif response.status == 400:
+                        raise BraveSearchError("Invalid search parameters.", response.status)
+                    elif response.status >= 500:
+                        error = BraveSearchError(f"API request failed with status {response.status}", response.status)
+                    else:
+                        raise BraveSearchError(f"API request failed with status {response.status}", response.status)
+        except aiohttp.ClientError as e:
+            error = BraveSearchError(f"Network error: {str(e)}")
+        
+        if attempt + 1 < BRAVE_MAX_ATTEMPTS:
+            delay = retry_delay(attempt, retry_after)
+            logger.warning("Brave request failed (%s), retrying in %.1fs", error, delay)
+            await asyncio.sleep(delay)
+    
+    raise error
+
+def extract_search_results(
+    data: Dict[str, Any],
+    sections: Sequence[str] = ("web", "news", "faq")
+) -> List[SearchResult]:
     """
     Extract and format search results from Brave API response
+
+    Only the requested sections are formatted, so callers that need one
+    result type do not build rows for the others.
     """
     results = []
     
     # Web results
-    if "web" in data and "results" in data["web"]:
-        for result in data["web"]["results"]:
-            results.append({
-                "type": "web",
-                "title": result.get("title", ""),
-                "url": result.get("url", ""),
-                "description": result.get("description", ""),
-                "snippet": result.get("snippet", ""),
-                "age": result.get("age", ""),
-                "language": result.get("language", "")
-            })
+    if "web" in sections:
+        results.extend([
+            WebResult(
+                title=result.get("title", ""),
+                url=result.get("url", ""),
+                description=result.get("description", ""),
+                snippet=result.get("snippet", ""),
+                age=result.get("age", ""),
+                language=result.get("language", "")
+            )
+            for result in data.get("web", EMPTY_MAPPING).get("results", ())
+        ])
     
     # News results
-    if "news" in data and "results" in data["news"]:
-        for result in data["news"]["results"]:
-            results.append({
-                "type": "news",
-                "title": result.get("title", ""),
-                "url": result.get("url", ""),
-                "description": result.get("description", ""),
-                "age": result.get("age", ""),
-                "source": result.get("meta_url", {}).get("hostname", "")
-            })
+    if "news" in sections:
+        results.extend([
+            NewsResult(
+                title=result.get("title", ""),
+                url=result.get("url", ""),
+                description=result.get("description", ""),
+                age=result.get("age", ""),
+                source=result.get("meta_url", EMPTY_MAPPING).get("hostname", "")
+            )
+            for result in data.get("news", EMPTY_MAPPING).get("results", ())
+        ])
     
     # FAQ results
-    if "faq" in data and "results" in data["faq"]:
-        for result in data["faq"]["results"]:
-            results.append({
-                "type": "faq",
-                "question": result.get("question", ""),
-                "answer": result.get("answer", ""),
-                "title": result.get("title", ""),
-                "url": result.get("url", "")
-            })
+    if "faq" in sections:
+        results.extend([
+            FAQResult(
+                question=result.get("question", ""),
+                answer=result.get("answer", ""),
+                title=result.get("title", ""),
+                url=result.get("url", "")
+            )
+            for result in data.get("faq", EMPTY_MAPPING).get("results", ())
+        ])
     
     return results
 
-def is_cache_valid(timestamp: datetime) -> bool:
-    """Check if cached result is still valid"""
-    return datetime.now() - timestamp < cache_ttl
+def make_cache_key(kind: str, *parts: Any) -> bytes:
+    """Build a fixed-size cache key; surrounding whitespace in strings is ignored
+
+    Case is kept: Brave treats uppercase AND/OR/NOT in a query as operators,
+    so callers fold case only for fields that are case-insensitive.
+    """
+    canonical = (kind, *(part.strip() if isinstance(part, str) else part for part in parts))
+    return hashlib.blake2b(repr(canonical).encode(), digest_size=16).digest()
+
+# Short-lived cache of client errors, so a bad query is not re-sent on every retry by the caller
+error_cache = TTLCache(maxsize=256, ttl=timedelta(seconds=60))
+
+# Fetches currently in flight, so concurrent cache misses share one API request
+inflight_requests: Dict[bytes, "asyncio.Task[Any]"] = {}
+
+async def single_flight(cache_key: bytes, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Await fetch(), or the identical fetch another caller already started"""
+    task = inflight_requests.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight_requests[cache_key] = task
+        task.add_done_callback(lambda _: inflight_requests.pop(cache_key, None))
+    # Shielded so one caller being cancelled does not cancel the fetch for the others
+    return await asyncio.shield(task)
 
 @mcp.tool()
 async def web_search(
@@ -162,7 +360,7 @@ async def web_search(
     country: str = "US",
     search_lang: str = "en",
     freshness: Optional[str] = None
-) -> List[Dict[str, Any]]:
+) -> List[Union[SearchResult, Dict[str, Any]]]:
     """
     Perform a web search using Brave Search API
     
@@ -178,12 +376,15 @@ async def web_search(
         List of search results with title, URL, description, and metadata
     """
     # Check cache first
-    cache_key = f"web:{query}:{count}:{offset}:{country}:{search_lang}:{freshness}"
-    if cache_key in search_cache:
-        cached_result, timestamp = search_cache[cache_key]
-        if is_cache_valid(timestamp):
-            logger.info(f"Returning cached result for query: {query}")
-            return cached_result
+    cache_key = make_cache_key("web", query, count, offset, country.lower(), search_lang.lower(), freshness)
+    cached_result = search_cache.get(cache_key)
+    if cached_result is not None:
+        logger.info("Returning cached result for query: %s", query)
+        return cached_result
+    cached_error = error_cache.get(cache_key)
+    if cached_error is not None:
+        logger.warning("Returning cached error for query '%s': %s", query, cached_error)
+        return [{"error": cached_error, "query": query}]
     
     params = {
         "q": query,
@@ -197,20 +398,24 @@ async def web_search(
     if freshness:
         params["freshness"] = freshness
     
-    async with aiohttp.ClientSession() as session:
-        try:
-            data = await make_brave_request("web/search", params, session)
-            results = extract_search_results(data)
-            
-            # Cache the results
-            search_cache[cache_key] = (results, datetime.now())
-            
-            logger.info(f"Found {len(results)} results for query: {query}")
-            return results
-            
-        except BraveSearchError as e:
-            logger.error(f"Search failed for query '{query}': {str(e)}")
-            return [{"error": str(e), "query": query}]
+    async def fetch() -> List[SearchResult]:
+        data = await make_brave_request("web/search", params)
+        results = extract_search_results(data)
+        
+        # Cache the results
+        search_cache.set(cache_key, results)
+        return results
+    
+    try:
+        results = await single_flight(cache_key, fetch)
+        logger.info("Found %d results for query: %s", len(results), query)
+        return results
+        
+    except BraveSearchError as e:
+        if e.is_client_error:
+            error_cache.set(cache_key, str(e))
+        logger.error("Search failed for query '%s': %s", query, e)
+        return [{"error": str(e), "query": query}]
 
 @mcp.tool()
 async def news_search(
@@ -220,7 +425,7 @@ async def news_search(
     country: str = "US",
     search_lang: str = "en",
     freshness: str = "pw"
-) -> List[Dict[str, Any]]:
+) -> List[Union[SearchResult, Dict[str, Any]]]:
     """
     Search for recent news articles using Brave Search API
     
@@ -236,12 +441,15 @@ async def news_search(
         List of news articles with title, URL, description, source, and publication date
     """
     # Check cache first
-    cache_key = f"news:{query}:{count}:{offset}:{country}:{search_lang}:{freshness}"
-    if cache_key in search_cache:
-        cached_result, timestamp = search_cache[cache_key]
-        if is_cache_valid(timestamp):
-            logger.info(f"Returning cached news result for query: {query}")
-            return cached_result
+    cache_key = make_cache_key("news", query, count, offset, country.lower(), search_lang.lower(), freshness)
+    cached_result = search_cache.get(cache_key)
+    if cached_result is not None:
+        logger.info("Returning cached news result for query: %s", query)
+        return cached_result
+    cached_error = error_cache.get(cache_key)
+    if cached_error is not None:
+        logger.warning("Returning cached error for query '%s': %s", query, cached_error)
+        return [{"error": cached_error, "query": query}]
     
     params = {
         "q": query,
@@ -253,23 +461,25 @@ async def news_search(
         "freshness": freshness
     }
     
-    async with aiohttp.ClientSession() as session:
-        try:
-            data = await make_brave_request("web/search", params, session)
-            results = extract_search_results(data)
-            
-            # Filter for news results only
-            news_results = [r for r in results if r.get("type") == "news"]
-            
-            # Cache the results
-            search_cache[cache_key] = (news_results, datetime.now())
-            
-            logger.info(f"Found {len(news_results)} news results for query: {query}")
-            return news_results
-            
-        except BraveSearchError as e:
-            logger.error(f"News search failed for query '{query}': {str(e)}")
-            return [{"error": str(e), "query": query}]
+    async def fetch() -> List[SearchResult]:
+        data = await make_brave_request("web/search", params)
+        # Extract news results only
+        news_results = extract_search_results(data, sections=("news",))
+        
+        # Cache the results
+        search_cache.set(cache_key, news_results)
+        return news_results
+    
+    try:
+        news_results = await single_flight(cache_key, fetch)
+        logger.info("Found %d news results for query: %s", len(news_results), query)
+        return news_results
+        
+    except BraveSearchError as e:
+        if e.is_client_error:
+            error_cache.set(cache_key, str(e))
+        logger.error("News search failed for query '%s': %s", query, e)
+        return [{"error": str(e), "query": query}]
 
 @mcp.tool()
 async def smart_search(
@@ -295,47 +505,76 @@ async def smart_search(
         {"query": query.replace(" ", " AND "), "params": {}},  # AND search
     ]
     
+    async def run_strategy(attempt: int, strategy: Dict[str, Any]) -> Tuple[Dict[str, Any], List[SearchResult]]:
+        params = {
+            "q": strategy["query"],
+            "count": 20,
+            "result_filter": "web",
+            **strategy["params"]
+        }
+        
+        logger.info("Attempt %d: Searching for '%s'", attempt, strategy['query'])
+        try:
+            data = await make_brave_request("web/search", params)
+        except BraveSearchError as e:
+            logger.warning("Attempt %d failed: %s", attempt, e)
+            return {
+                "attempt": attempt,
+                "query": strategy["query"],
+                "params": strategy["params"],
+                "error": str(e),
+                "success": False
+            }, []
+        
+        results = extract_search_results(data)
+        return {
+            "attempt": attempt,
+            "query": strategy["query"],
+            "params": strategy["params"],
+            "result_count": len(results),
+            "success": len(results) >= result_threshold
+        }, results
+    
+    # Run the strategies concurrently. The earliest successful strategy still
+    # wins, so a success only cancels the strategies ranked after it.
+    tasks = {
+        asyncio.create_task(run_strategy(attempt, strategy)): attempt
+        for attempt, strategy in enumerate(search_strategies[:max_attempts], 1)
+    }
+    outcomes = {}
+    winner = None
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                entry, results = task.result()
+                outcomes[entry["attempt"]] = (entry, results)
+                if entry["success"] and (winner is None or entry["attempt"] < winner):
+                    winner = entry["attempt"]
+            if winner is not None:
+                for task in pending:
+                    if tasks[task] > winner:
+                        task.cancel()
+                pending = {task for task in pending if tasks[task] < winner}
+    finally:
+        for task in pending:
+            task.cancel()
+    
     search_history = []
     best_results = []
+    for attempt in sorted(outcomes):
+        if winner is not None and attempt > winner:
+            continue
+        entry, results = outcomes[attempt]
+        search_history.append(entry)
+        if attempt == winner:
+            best_results = results
+        elif winner is None and len(results) > len(best_results):
+            best_results = results
     
-    async with aiohttp.ClientSession() as session:
-        for attempt, strategy in enumerate(search_strategies[:max_attempts], 1):
-            try:
-                params = {
-                    "q": strategy["query"],
-                    "count": 20,
-                    "result_filter": "web",
-                    **strategy["params"]
-                }
-                
-                logger.info(f"Attempt {attempt}: Searching for '{strategy['query']}'")
-                data = await make_brave_request("web/search", params, session)
-                results = extract_search_results(data)
-                
-                search_history.append({
-                    "attempt": attempt,
-                    "query": strategy["query"],
-                    "params": strategy["params"],
-                    "result_count": len(results),
-                    "success": len(results) >= result_threshold
-                })
-                
-                if len(results) >= result_threshold:
-                    best_results = results
-                    logger.info(f"Successful search on attempt {attempt} with {len(results)} results")
-                    break
-                elif len(results) > len(best_results):
-                    best_results = results
-                    
-            except BraveSearchError as e:
-                search_history.append({
-                    "attempt": attempt,
-                    "query": strategy["query"],
-                    "params": strategy["params"],
-                    "error": str(e),
-                    "success": False
-                })
-                logger.warning(f"Attempt {attempt} failed: {str(e)}")
+    if winner is not None:
+        logger.info("Successful search on attempt %d with %d results", winner, len(best_results))
     
     return {
         "results": best_results,
@@ -396,58 +635,48 @@ async def research_search(
         "results": {}
     }
     
-    async with aiohttp.ClientSession() as session:
-        # Primary web search
+    # Primary web search
+    web_params = {
+        "q": topic,
+        "count": config["web_count"],
+        "result_filter": "web"
+    }
+    if freshness:
+        web_params["freshness"] = freshness
+    section_params = {"web": web_params}
+    
+    # Academic search (using specific academic terms)
+    if include_academic:
+        academic_query = f"{topic} site:edu OR site:org OR filetype:pdf OR academic OR research OR study"
+        section_params["academic"] = {
+            "q": academic_query,
+            "count": 10,
+            "result_filter": "web"
+        }
+    
+    # News search
+    if include_news:
+        section_params["news"] = {
+            "q": topic,
+            "count": config["news_count"],
+            "result_filter": "news",
+            "freshness": "pm"  # Past month for news
+        }
+    
+    async def fetch_section(params: Dict[str, Any]) -> List[Union[SearchResult, Dict[str, Any]]]:
         try:
-            web_params = {
-                "q": topic,
-                "count": config["web_count"],
-                "result_filter": "web"
-            }
-            if freshness:
-                web_params["freshness"] = freshness
-            
-            web_data = await make_brave_request("web/search", web_params, session)
-            research_results["results"]["web"] = extract_search_results(web_data)
-            
+            data = await make_brave_request("web/search", params)
+            return extract_search_results(data)
         except BraveSearchError as e:
-            research_results["results"]["web"] = [{"error": str(e)}]
-        
-        # Academic search (using specific academic terms)
-        if include_academic:
-            try:
-                academic_query = f"{topic} site:edu OR site:org OR filetype:pdf OR academic OR research OR study"
-                academic_params = {
-                    "q": academic_query,
-                    "count": 10,
-                    "result_filter": "web"
-                }
-                
-                academic_data = await make_brave_request("web/search", academic_params, session)
-                research_results["results"]["academic"] = extract_search_results(academic_data)
-                
-            except BraveSearchError as e:
-                research_results["results"]["academic"] = [{"error": str(e)}]
-        
-        # News search
-        if include_news:
-            try:
-                news_params = {
-                    "q": topic,
-                    "count": config["news_count"],
-                    "result_filter": "news",
-                    "freshness": "pm"  # Past month for news
-                }
-                
-                news_data = await make_brave_request("web/search", news_params, session)
-                research_results["results"]["news"] = extract_search_results(news_data)
-                
-            except BraveSearchError as e:
-                research_results["results"]["news"] = [{"error": str(e)}]
+            return [{"error": str(e)}]
+    
+    # The sections are independent, so run them concurrently
+    sections = await asyncio.gather(*(fetch_section(params) for params in section_params.values()))
+    research_results["results"] = dict(zip(section_params, sections))
     
     # Calculate summary statistics
     total_results = sum(
-        len([r for r in section if "error" not in r]) 
+        sum(1 for r in section if isinstance(r, SearchResult))
         for section in research_results["results"].values()
     )
     
@@ -461,22 +690,199 @@ async def research_search(
 
 # PROMPTS - Intelligent search templates
 
-@mcp.prompt()
-def debugging_search_prompt(
+# Static prompt sections, built once at import; the prompts only format their dynamic parts
+
+DEBUGGING_SEARCH_GUIDANCE = """
+## Search Tips
+
+1. **Start with the exact error message** in quotes for precise matches
+2. **Add your programming language** to filter relevant results
+3. **Include framework/library names** if applicable
+4. **Check Stack Overflow first** for community solutions
+5. **Look for official documentation** and GitHub issues
+6. **Try variations** of the error message if no results found
+
+## Suggested Tools
+
+Use these MCP tools for your search:
+- `web_search()` for general searches
+- `smart_search()` for persistent searching with multiple strategies
+- `research_search()` for comprehensive investigation
+
+## Next Steps
+
+1. Try the first search query
+2. If no results, move to the next query
+3. Look for recent solutions (past year)
+4. Check official documentation
+5. Consider similar error patterns
+"""
+
+RESEARCH_FOUNDATION_STEPS = {
+    "factual": """
+1. **Direct Search**: Search for the exact question or key terms
+2. **Authoritative Sources**: Look for official sources, encyclopedias, verified data
+3. **Cross-Reference**: Verify information across multiple reliable sources
+""",
+    "comparative": """
+1. **Individual Research**: Research each item/concept separately first
+2. **Comparison Search**: Search for direct comparisons and versus articles
+3. **Expert Analysis**: Look for professional analysis and reviews
+""",
+    "trend_analysis": """
+1. **Current State**: Research the present situation
+2. **Historical Context**: Understand past trends and patterns
+3. **Future Projections**: Look for expert predictions and analysis
+""",
+    "general": """
+1. **Broad Overview**: Start with general searches to understand the topic
+2. **Specific Aspects**: Dive deeper into particular aspects
+3. **Multiple Perspectives**: Gather different viewpoints and approaches
+""",
+}
+
+RESEARCH_VERIFICATION_GUIDANCE = """
+### Phase 3: Verification and Synthesis
+
+1. **Source Quality Check**:
+   - Verify credibility of sources
+   - Look for peer-reviewed content
+   - Check publication dates
+   - Cross-reference facts
+
+2. **Gap Analysis**:
+   - Identify missing information
+   - Note conflicting viewpoints
+   - Find areas needing more research
+
+3. **Synthesis Preparation**:
+   - Organize findings by theme
+   - Note source reliability
+   - Prepare balanced summary
+
+## Quality Indicators
+
+**Good Sources Look For**:
+- Recent publication dates (if current info needed)
+- Author credentials and expertise
+- Peer review or editorial oversight
+- Citation of other reliable sources
+- Balanced presentation of information
+
+**Red Flags to Avoid**:
+- Outdated information (unless historical research)
+- Unclear authorship
+- Extreme bias without balance
+- Lack of supporting evidence
+- Poor source citations
+
+## Recommended MCP Tools Sequence
+
+1. `research_search()` for comprehensive initial research
+2. `smart_search()` for persistent searching if results are sparse
+3. `news_search()` for current developments and recent information
+4. `web_search()` for specific follow-up queries
+
+## Success Metrics
+
+- **Coverage**: Multiple perspectives and sources represented
+- **Reliability**: High-quality, credible sources prioritized
+- **Relevance**: Information directly addresses the research question
+- **Recency**: Up-to-date information when time-sensitive
+- **Depth**: Sufficient detail for the intended depth level
+"""
+
+FACT_CHECK_EVALUATION_GUIDANCE = """
+## Evaluation Framework
+
+### Source Credibility Checklist
+- [ ] **Author/Organization**: Clearly identified and reputable
+- [ ] **Publication Date**: Recent enough to be relevant
+- [ ] **Citations**: Includes references and sources
+- [ ] **Methodology**: Clear research or reporting methods
+- [ ] **Bias Check**: Consider potential conflicts of interest
+
+### Evidence Quality
+- [ ] **Primary Sources**: Original research, documents, or data
+- [ ] **Secondary Sources**: Analysis or reporting of primary sources
+- [ ] **Expert Opinion**: Qualified specialists in relevant field
+- [ ] **Consensus**: Agreement among multiple reliable sources
+
+### Red Flags
+- [ ] **No author or unclear authorship**
+- [ ] **Extreme bias or emotional language**
+- [ ] **Lack of supporting evidence**
+- [ ] **Outdated information**
+- [ ] **Known unreliable source**
+
+## Verification Levels
+
+### High Confidence
+- Multiple authoritative sources confirm
+- Primary evidence available
+- Expert consensus exists
+- No credible contradictions
+
+### Medium Confidence
+- Some reliable sources confirm
+- Limited primary evidence
+- Some expert support
+- Minor contradictions exist
+
+### Low Confidence
+- Few or questionable sources
+- Lack of primary evidence
+- No clear expert consensus
+- Significant contradictions
+
+### Insufficient Evidence
+- Very few sources
+- No reliable verification
+- Conflicting information
+- More research needed
+
+## Recommended MCP Tool Sequence
+
+1. **Initial Search**: `web_search()` with exact claim in quotes
+2. **Authority Check**: `web_search()` with official/academic modifiers
+3. **Counter-research**: `web_search()` looking for refutations
+4. **Comprehensive Review**: `research_search()` for thorough analysis
+5. **Recent Updates**: `news_search()` for latest developments
+
+## Documentation Template
+
+"""
+
+FACT_CHECK_REPORT_TEMPLATE = """
+
+**Verification Status**: [High/Medium/Low Confidence | Insufficient Evidence]
+
+**Key Findings**:
+- Supporting Evidence: [List sources that confirm]
+- Contradicting Evidence: [List sources that refute]
+- Expert Opinion: [Relevant expert statements]
+
+**Source Summary**:
+- Total sources reviewed: [Number]
+- Authoritative sources: [Number]
+- Quality assessment: [Brief evaluation]
+
+**Conclusion**: [Summary of verification results]
+
+**Last Updated**: [Date of fact-check]
+"""
+
+# The prompt builders are pure functions of their arguments, so repeated
+# requests for the same prompt reuse the rendered text
+
+@lru_cache(maxsize=256)
+def build_debugging_search_prompt(
     error_message: str,
     programming_language: str = "",
     framework: str = "",
     context: str = ""
 ) -> str:
-    """
-    Generate an effective search strategy for debugging programming issues
-    
-    Args:
-        error_message: The error message or issue description
-        programming_language: Programming language being used
-        framework: Framework or library being used
-        context: Additional context about the problem
-    """
+    """Build the debugging search prompt text"""
     
     # Create targeted search queries for debugging
     search_queries = []
@@ -503,7 +909,7 @@ def debugging_search_prompt(
         stackoverflow_query += f" {programming_language}"
     search_queries.append(stackoverflow_query)
     
-    prompt_content = f"""# Debugging Search Strategy
+    parts = [f"""# Debugging Search Strategy
 
 ## Problem Analysis
 - **Error Message**: {error_message}
@@ -515,55 +921,38 @@ def debugging_search_prompt(
 
 Here are optimized search queries to help you find solutions:
 
-"""
+"""]
+    parts.extend(f"{i}. `{query}`\n" for i, query in enumerate(search_queries, 1))
+    parts.append(DEBUGGING_SEARCH_GUIDANCE)
     
-    for i, query in enumerate(search_queries, 1):
-        prompt_content += f"{i}. `{query}`\n"
-    
-    prompt_content += """
-## Search Tips
-
-1. **Start with the exact error message** in quotes for precise matches
-2. **Add your programming language** to filter relevant results
-3. **Include framework/library names** if applicable
-4. **Check Stack Overflow first** for community solutions
-5. **Look for official documentation** and GitHub issues
-6. **Try variations** of the error message if no results found
-
-## Suggested Tools
-
-Use these MCP tools for your search:
-- `web_search()` for general searches
-- `smart_search()` for persistent searching with multiple strategies
-- `research_search()` for comprehensive investigation
-
-## Next Steps
+    return "".join(parts)
 
-1. Try the first search query
-2. If no results, move to the next query
-3. Look for recent solutions (past year)
-4. Check official documentation
-5. Consider similar error patterns
-"""
+@mcp.prompt()
+def debugging_search_prompt(
+    error_message: str,
+    programming_language: str = "",
+    framework: str = "",
+    context: str = ""
+) -> str:
+    """
+    Generate an effective search strategy for debugging programming issues
     
-    return prompt_content
+    Args:
+        error_message: The error message or issue description
+        programming_language: Programming language being used
+        framework: Framework or library being used
+        context: Additional context about the problem
+    """
+    return build_debugging_search_prompt(error_message, programming_language, framework, context)
 
-@mcp.prompt()
-def research_strategy_prompt(
+@lru_cache(maxsize=256)
+def build_research_strategy_prompt(
     research_question: str,
     domain: str = "",
     depth_level: str = "medium",
     time_sensitivity: str = "balanced"
 ) -> str:
-    """
-    Generate a comprehensive research strategy for any topic or question
-    
-    Args:
-        research_question: The main research question or topic
-        domain: Subject domain (e.g., "technology", "medicine", "business")
-        depth_level: Research depth ("overview", "medium", "comprehensive")
-        time_sensitivity: Time focus ("current", "historical", "balanced")
-    """
+    """Build the research strategy prompt text"""
     
     # Analyze the research question
     question_type = "general"
@@ -596,7 +985,7 @@ def research_strategy_prompt(
     
     strategy = search_strategies.get(depth_level, search_strategies["medium"])
     
-    prompt_content = f"""# Research Strategy: {research_question}
+    parts = [f"""# Research Strategy: {research_question}
 
 ## Research Analysis
 - **Question Type**: {question_type.replace('_', ' ').title()}
@@ -607,34 +996,9 @@ def research_strategy_prompt(
 ## Recommended Search Approach
 
 ### Phase 1: Foundation Research
-"""
-    
-    if question_type == "factual":
-        prompt_content += """
-1. **Direct Search**: Search for the exact question or key terms
-2. **Authoritative Sources**: Look for official sources, encyclopedias, verified data
-3. **Cross-Reference**: Verify information across multiple reliable sources
-"""
-    elif question_type == "comparative":
-        prompt_content += """
-1. **Individual Research**: Research each item/concept separately first
-2. **Comparison Search**: Search for direct comparisons and versus articles
-3. **Expert Analysis**: Look for professional analysis and reviews
-"""
-    elif question_type == "trend_analysis":
-        prompt_content += """
-1. **Current State**: Research the present situation
-2. **Historical Context**: Understand past trends and patterns
-3. **Future Projections**: Look for expert predictions and analysis
-"""
-    else:
-        prompt_content += """
-1. **Broad Overview**: Start with general searches to understand the topic
-2. **Specific Aspects**: Dive deeper into particular aspects
-3. **Multiple Perspectives**: Gather different viewpoints and approaches
-"""
+""", RESEARCH_FOUNDATION_STEPS[question_type]]
     
-    prompt_content += f"""
+    parts.append(f"""
 ### Phase 2: Deep Investigation
 
 **Recommended Tools and Queries:**
@@ -654,13 +1018,13 @@ def research_strategy_prompt(
    - "{research_question}"
    - {research_question.replace('?', '')} analysis
    - {research_question.replace('?', '')} expert opinion
-"""
+""")
     
     if domain:
-        prompt_content += f"   - {research_question.replace('?', '')} {domain}\n"
+        parts.append(f"   - {research_question.replace('?', '')} {domain}\n")
     
     if time_sensitivity == "current":
-        prompt_content += f"""
+        parts.append(f"""
 3. **Recent Developments**:
    ```
    news_search(
@@ -669,77 +1033,39 @@ def research_strategy_prompt(
        count=10
    )
    ```
-"""
+""")
     
-    prompt_content += """
-### Phase 3: Verification and Synthesis
-
-1. **Source Quality Check**:
-   - Verify credibility of sources
-   - Look for peer-reviewed content
-   - Check publication dates
-   - Cross-reference facts
-
-2. **Gap Analysis**:
-   - Identify missing information
-   - Note conflicting viewpoints
-   - Find areas needing more research
-
-3. **Synthesis Preparation**:
-   - Organize findings by theme
-   - Note source reliability
-   - Prepare balanced summary
-
-## Quality Indicators
-
-**Good Sources Look For**:
-- Recent publication dates (if current info needed)
-- Author credentials and expertise
-- Peer review or editorial oversight
-- Citation of other reliable sources
-- Balanced presentation of information
-
-**Red Flags to Avoid**:
-- Outdated information (unless historical research)
-- Unclear authorship
-- Extreme bias without balance
-- Lack of supporting evidence
-- Poor source citations
-
-## Recommended MCP Tools Sequence
-
-1. `research_search()` for comprehensive initial research
-2. `smart_search()` for persistent searching if results are sparse
-3. `news_search()` for current developments and recent information
-4. `web_search()` for specific follow-up queries
-
-## Success Metrics
-
-- **Coverage**: Multiple perspectives and sources represented
-- **Reliability**: High-quality, credible sources prioritized
-- **Relevance**: Information directly addresses the research question
-- **Recency**: Up-to-date information when time-sensitive
-- **Depth**: Sufficient detail for the intended depth level
-"""
+    parts.append(RESEARCH_VERIFICATION_GUIDANCE)
     
-    return prompt_content
+    return "".join(parts)
 
 @mcp.prompt()
-def fact_check_prompt(
-    claim: str,
-    urgency: str = "normal",
-    source_preference: str = "balanced"
+def research_strategy_prompt(
+    research_question: str,
+    domain: str = "",
+    depth_level: str = "medium",
+    time_sensitivity: str = "balanced"
 ) -> str:
     """
-    Generate a systematic fact-checking strategy for verifying claims
+    Generate a comprehensive research strategy for any topic or question
     
     Args:
-        claim: The statement or claim to fact-check
-        urgency: Urgency level ("low", "normal", "high")
-        source_preference: Source preference ("official", "academic", "news", "balanced")
+        research_question: The main research question or topic
+        domain: Subject domain (e.g., "technology", "medicine", "business")
+        depth_level: Research depth ("overview", "medium", "comprehensive")
+        time_sensitivity: Time focus ("current", "historical", "balanced")
     """
+    return build_research_strategy_prompt(research_question, domain, depth_level, time_sensitivity)
+
+@lru_cache(maxsize=256)
+def build_fact_check_prompt(
+    claim: str,
+    urgency: str = "normal",
+    source_preference: str = "balanced"
+) -> str:
+    """Build the fact check prompt text"""
     
-    prompt_content = f"""# Fact-Check Strategy: {claim}
+    parts = [f"""# Fact-Check Strategy: {claim}
 
 ## Claim Analysis
 - **Statement**: {claim}
@@ -760,10 +1086,10 @@ web_search(
 ```
 
 ### Step 2: Authority Sources
-"""
+"""]
     
     if source_preference in ["official", "balanced"]:
-        prompt_content += f"""
+        parts.append(f"""
 **Official Sources Search**:
 ```
 web_search(
@@ -771,10 +1097,10 @@ web_search(
     count=10
 )
 ```
-"""
+""")
     
     if source_preference in ["academic", "balanced"]:
-        prompt_content += f"""
+        parts.append(f"""
 **Academic Sources Search**:
 ```
 web_search(
@@ -782,10 +1108,10 @@ web_search(
     count=10
 )
 ```
-"""
+""")
     
     if source_preference in ["news", "balanced"]:
-        prompt_content += f"""
+        parts.append(f"""
 **News and Media Analysis**:
 ```
 news_search(
@@ -794,9 +1120,9 @@ news_search(
     count=10
 )
 ```
-"""
+""")
     
-    prompt_content += f"""
+    parts.append(f"""
 ### Step 3: Counterargument Research
 ```
 web_search(
@@ -812,95 +1138,47 @@ web_search(
     count=10
 )
 ```
+""")
+    parts.append(FACT_CHECK_EVALUATION_GUIDANCE)
+    parts.append(f"**Claim**: {claim}")
+    parts.append(FACT_CHECK_REPORT_TEMPLATE)
+    
+    return "".join(parts)
 
-## Evaluation Framework
-
-### Source Credibility Checklist
-- [ ] **Author/Organization**: Clearly identified and reputable
-- [ ] **Publication Date**: Recent enough to be relevant
-- [ ] **Citations**: Includes references and sources
-- [ ] **Methodology**: Clear research or reporting methods
-- [ ] **Bias Check**: Consider potential conflicts of interest
-
-### Evidence Quality
-- [ ] **Primary Sources**: Original research, documents, or data
-- [ ] **Secondary Sources**: Analysis or reporting of primary sources
-- [ ] **Expert Opinion**: Qualified specialists in relevant field
-- [ ] **Consensus**: Agreement among multiple reliable sources
-
-### Red Flags
-- [ ] **No author or unclear authorship**
-- [ ] **Extreme bias or emotional language**
-- [ ] **Lack of supporting evidence**
-- [ ] **Outdated information**
-- [ ] **Known unreliable source**
-
-## Verification Levels
-
-### High Confidence
-- Multiple authoritative sources confirm
-- Primary evidence available
-- Expert consensus exists
-- No credible contradictions
-
-### Medium Confidence
-- Some reliable sources confirm
-- Limited primary evidence
-- Some expert support
-- Minor contradictions exist
-
-### Low Confidence
-- Few or questionable sources
-- Lack of primary evidence
-- No clear expert consensus
-- Significant contradictions
-
-### Insufficient Evidence
-- Very few sources
-- No reliable verification
-- Conflicting information
-- More research needed
-
-## Recommended MCP Tool Sequence
-
-1. **Initial Search**: `web_search()` with exact claim in quotes
-2. **Authority Check**: `web_search()` with official/academic modifiers
-3. **Counter-research**: `web_search()` looking for refutations
-4. **Comprehensive Review**: `research_search()` for thorough analysis
-5. **Recent Updates**: `news_search()` for latest developments
-
-## Documentation Template
-
-**Claim**: {claim}
-
-**Verification Status**: [High/Medium/Low Confidence | Insufficient Evidence]
-
-**Key Findings**:
-- Supporting Evidence: [List sources that confirm]
-- Contradicting Evidence: [List sources that refute]
-- Expert Opinion: [Relevant expert statements]
-
-**Source Summary**:
-- Total sources reviewed: [Number]
-- Authoritative sources: [Number]
-- Quality assessment: [Brief evaluation]
-
-**Conclusion**: [Summary of verification results]
-
-**Last Updated**: [Date of fact-check]
-"""
+@mcp.prompt()
+def fact_check_prompt(
+    claim: str,
+    urgency: str = "normal",
+    source_preference: str = "balanced"
+) -> str:
+    """
+    Generate a systematic fact-checking strategy for verifying claims
     
-    return prompt_content
+    Args:
+        claim: The statement or claim to fact-check
+        urgency: Urgency level ("low", "normal", "high")
+        source_preference: Source preference ("official", "academic", "news", "balanced")
+    """
+    return build_fact_check_prompt(claim, urgency, source_preference)
+
+async def run_server() -> None:
+    """Serve over stdio, closing the shared HTTP session when the process stops serving"""
+    # The session outlives any single client connection, so it is closed here
+    # rather than in a per-connection lifespan
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await close_http_session()
 
 def main():
     """Main entry point for the server"""
     try:
         logger.info("Starting Brave Search MCP Server...")
-        mcp.run()
+        asyncio.run(run_server())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+import math
+
+import pytest
+
+import server
+
+
+@pytest.mark.parametrize("retry_after", ["nan", "NaN", "inf", "-inf", "Infinity"])
+def test_non_finite_retry_after_falls_back_to_backoff(retry_after):
+    delay = server.retry_delay(1, retry_after)
+    assert math.isfinite(delay)
+    assert 2 <= delay < 3
+
+
+def test_retry_after_is_clamped():
+    assert server.retry_delay(1, "5") == 5.0
+    assert server.retry_delay(1, "-5") == 0.0
+    assert server.retry_delay(1, "9999") == server.BRAVE_MAX_BACKOFF
+
+
+def test_unparseable_retry_after_falls_back_to_backoff():
+    assert 2 <= server.retry_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT") < 3